@@ -1,23 +1,56 @@
 import argparse
 import csv
+import io
+import operator
 import os
+import re
 import sys
-from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
-from typing import List, Tuple, Dict, Optional
-
-import pdfplumber
+from functools import lru_cache
+from typing import Iterator, List, Tuple, Optional, Union
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+try:
+    import pymupdf
+except ImportError:
+    # PyMuPDF is the fast C-backed PDF backend; pdfplumber remains the
+    # pure-Python fallback when it is not installed.
+    pymupdf = None
+
+try:
+    import pandas as pd
+except ImportError:
+    # pandas is optional: it only enables the vectorized batch-validation
+    # path; the per-record loop is used when it is not installed.
+    pd = None
+
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    # numba is likewise optional: it JIT-compiles the Luhn and age
+    # kernels used by the batch path when available.
+    numba = None
 
 
 # ==============================
 # Data model
 # ==============================
 
-@dataclass
+@dataclass(slots=True)
 class PatientRecord:
     """
     Normalized representation of a single patient claim record.
     All dates are stored in ISO format (YYYY-MM-DD).
+
+    slots=True drops the per-instance __dict__, roughly halving memory
+    per record and speeding attribute access during CSV writing.
     """
     PatientID: str
     HealthCardNumber: str
@@ -26,10 +59,91 @@ class PatientRecord:
     ServiceDate: str   # ISO string
 
 
+@dataclass
+class ValidRecords:
+    """
+    Struct-of-arrays batch of valid records: five parallel column lists
+    instead of one PatientRecord object per row. Skips per-row object
+    and dict construction and lets the CSV writer emit every row in a
+    single zip+writerows pass.
+    """
+    patient_ids: List[str] = field(default_factory=list)
+    health_cards: List[str] = field(default_factory=list)
+    version_codes: List[str] = field(default_factory=list)
+    dobs: List[str] = field(default_factory=list)         # ISO strings
+    service_dates: List[str] = field(default_factory=list)  # ISO strings
+
+    def append(
+        self,
+        patient_id: str,
+        health_card: str,
+        version_code: str,
+        dob_iso: str,
+        service_iso: str,
+    ) -> None:
+        self.patient_ids.append(patient_id)
+        self.health_cards.append(health_card)
+        self.version_codes.append(version_code)
+        self.dobs.append(dob_iso)
+        self.service_dates.append(service_iso)
+
+    def columns(self) -> Tuple[List[str], ...]:
+        """Column lists in CSV field order."""
+        return (self.patient_ids, self.health_cards, self.version_codes,
+                self.dobs, self.service_dates)
+
+    def __len__(self) -> int:
+        return len(self.patient_ids)
+
+
 # ==============================
 # Utility functions
 # ==============================
 
+# Canonical record fields, in PatientRecord/CSV order. Header lookup is
+# done once per table (lowercased), so the per-row loop indexes fixed
+# slots instead of probing header-keyed dicts.
+FIELD_COUNT = 5
+CANONICAL_HEADERS = {
+    "patient id": 0,
+    "patientid": 0,
+    "health card number": 1,
+    "version code": 2,
+    "date of birth": 3,
+    "service date": 4,
+}
+
+# One raw record: (patient_id, health_card, version_code, dob, service)
+RawRecord = Tuple[str, str, str, str, str]
+
+# Compiled once so the common valid-format path in validate_record is a
+# single C-level regex match instead of a chain of str-method checks.
+# ASCII flag so _HC_RE doubles as the precondition for _luhn10's table.
+_HC_RE = re.compile(r"^\d{10}$", re.ASCII)
+_VC_RE = re.compile(r"^[A-Z]{2}$")
+
+# Accepts anything parse_date_flex could plausibly parse (ISO, slashed,
+# day-first, compact); used as a cheap stand-in for the full parse on
+# rows that are already rejected.
+_DATE_SHAPE_RE = re.compile(
+    r"^(?:\d{4}[-/]\d{1,2}[-/]\d{1,2}"
+    r"|\d{1,2}[-/]\d{1,2}[-/]\d{4}"
+    r"|\d{8})$",
+    re.ASCII,
+)
+
+# Luhn doubling with the >9 correction folded in.
+_DOUBLED = [d * 2 - 9 if d * 2 > 9 else d * 2 for d in range(10)]
+
+# Luhn contribution of every two-digit substring at an even offset of a
+# 10-digit number (first digit doubled, second taken as-is), so the full
+# check sums five table lookups with no per-digit arithmetic.
+_PAIR_SUM = {
+    "%d%d" % (a, b): _DOUBLED[a] + b
+    for a in range(10)
+    for b in range(10)
+}
+
 def luhn_check(number: str) -> bool:
     """
     Run Luhn (MOD 10) check on a numeric string.
@@ -41,24 +155,72 @@ def luhn_check(number: str) -> bool:
     Returns:
         True if the number passes the Luhn check, False otherwise.
     """
-    if not number.isdigit():
+    if not number.isascii() or not number.isdigit():
         return False
 
-    digits = [int(d) for d in number]
-    check_digit = digits[-1]
-    # Reverse all digits except the check digit
-    digits = digits[:-1][::-1]
-
+    # Walk the string right-to-left directly; no digit list, slice or
+    # reversal allocations. Odd positions (counting the check digit as 0)
+    # are the doubled ones.
     total = 0
-    for i, d in enumerate(digits):
-        if i % 2 == 0:
-            # Double every second digit (from the right in the original number)
-            d *= 2
+    for i, c in enumerate(reversed(number)):
+        d = ord(c) - 48
+        if i & 1:
+            d += d
             if d > 9:
                 d -= 9
         total += d
 
-    return (total + check_digit) % 10 == 0
+    return total % 10 == 0
+
+
+def _luhn10(s: str) -> bool:
+    """
+    Luhn (MOD 10) check specialized for a 10-ASCII-digit string, as
+    guaranteed by _HC_RE. Five pair-table lookups replace the per-digit
+    loop in luhn_check.
+    """
+    p = _PAIR_SUM
+    return (p[s[0:2]] + p[s[2:4]] + p[s[4:6]]
+            + p[s[6:8]] + p[s[8:10]]) % 10 == 0
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _luhn_batch(digits):
+        """
+        Luhn check over an N x 10 uint8 digit matrix; returns a bool
+        array. Compiled to a native loop, so the per-row cost is a few
+        integer ops with no interpreter involvement.
+        """
+        n = digits.shape[0]
+        out = np.empty(n, np.bool_)
+        for i in range(n):
+            total = 0
+            for j in range(10):
+                d = int(digits[i, j])
+                if j % 2 == 0:
+                    d += d
+                    if d > 9:
+                        d -= 9
+                total += d
+            out[i] = total % 10 == 0
+        return out
+
+    @numba.njit(cache=True)
+    def _age_batch(years, months, days, ty, tm, td):
+        """
+        Completed ages for Y/M/D int32 arrays against today's ty/tm/td;
+        native-code counterpart of age_in_years.
+        """
+        n = years.shape[0]
+        out = np.empty(n, np.int32)
+        for i in range(n):
+            age = ty - years[i]
+            if tm < months[i] or (tm == months[i] and td < days[i]):
+                age -= 1
+            out[i] = age
+        return out
 
 
 def parse_date_flex(
@@ -85,27 +247,86 @@ def parse_date_flex(
         errors.append(f"{field_name} is empty")
         return None
 
-    date_str = date_str.strip()
+    dt = _parse_date_cached(date_str.strip())
+    if dt is None:
+        errors.append(
+            f"{field_name} is not a valid date in supported formats "
+            f"(expected something like YYYY-MM-DD)"
+        )
+    return dt
+
+
+def _check_date_shape(
+    date_str: str,
+    field_name: str,
+    errors: List[str]
+) -> None:
+    """
+    Cheap stand-in for parse_date_flex on records the structural rules
+    have already rejected: only an error message is needed there, so a
+    single shape-regex match replaces the full parse. Range rules
+    (future date, age, 6-month window) are not evaluated here.
+    """
+    if not date_str:
+        errors.append(f"{field_name} is empty")
+    elif not _DATE_SHAPE_RE.match(date_str):
+        errors.append(
+            f"{field_name} is not a valid date in supported formats "
+            f"(expected something like YYYY-MM-DD)"
+        )
+
 
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[date]:
+    """
+    Parse a single date string, or return None if no supported format
+    matches. Cached because claim PDFs repeat the same ServiceDate (and
+    many DOBs) across rows, so a repeat costs one dict lookup instead of
+    a strptime run.
+    """
+    # Fast path: the vast majority of claim PDFs use ISO "YYYY-MM-DD",
+    # and date.fromisoformat is much cheaper than strptime. The shape
+    # guard keeps it to exactly that form — on Python 3.11+ an unguarded
+    # fromisoformat would also accept ISO week dates ("2024-W05-1"),
+    # widening what the validator treats as valid.
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
+
+    # Compact "YYYYMMDD" form: split manually instead of strptime.
+    if len(date_str) == 8 and date_str.isdigit():
+        try:
+            return date(int(date_str[:4]),
+                        int(date_str[4:6]),
+                        int(date_str[6:]))
+        except ValueError:
+            pass
+    elif len(date_str) == 10 and date_str[4] == "/" and date_str[7] == "/":
+        # "YYYY/MM/DD" is ISO with a different separator; normalize and
+        # retry under the same shape guard.
+        try:
+            return date.fromisoformat(date_str.replace("/", "-"))
+        except ValueError:
+            pass
+
+    # Slow path: formats the fast paths cannot cover still need
+    # strptime — day-first dates, plus year-first ones with unpadded
+    # month/day (e.g. "2024-1-3"), which fromisoformat rejects.
     patterns = [
         "%Y-%m-%d",
         "%Y/%m/%d",
         "%d-%m-%Y",
         "%d/%m/%Y",
-        "%Y%m%d",
     ]
 
     for pattern in patterns:
         try:
-            dt = datetime.strptime(date_str, pattern).date()
-            return dt
+            return datetime.strptime(date_str, pattern).date()
         except ValueError:
             continue
 
-    errors.append(
-        f"{field_name} is not a valid date in supported formats "
-        f"(expected something like YYYY-MM-DD)"
-    )
     return None
 
 
@@ -113,13 +334,16 @@ def age_in_years(dob: date, today: date) -> int:
     """
     Compute age in completed years.
 
+    Implemented on packed YYYYMMDD integers: the difference floor-divided
+    by 10000 yields completed years directly, replacing the month/day
+    tuple comparison with two integer ops.
+
     Example:
         dob = 2000-12-31, today = 2025-01-01 -> age = 24
     """
-    years = today.year - dob.year
-    if (today.month, today.day) < (dob.month, dob.day):
-        years -= 1
-    return years
+    dob_int = dob.year * 10000 + dob.month * 100 + dob.day
+    today_int = today.year * 10000 + today.month * 100 + today.day
+    return (today_int - dob_int) // 10000
 
 
 # ==============================
@@ -127,15 +351,22 @@ def age_in_years(dob: date, today: date) -> int:
 # ==============================
 
 def validate_record(
-    raw_record: Dict[str, str],
-    today: date
+    raw_record: RawRecord,
+    today: date,
+    six_months_ago: Optional[date] = None
 ) -> Tuple[bool, List[str], Optional[PatientRecord]]:
     """
     Validate a single raw record extracted from the PDF.
 
     Args:
-        raw_record: dictionary containing raw values from PDF.
+        raw_record: canonical field tuple (patient id, health card,
+            version code, date of birth, service date), as yielded by
+            extract_records_from_pdf. Header-name variants are resolved
+            once per table via CANONICAL_HEADERS, not per record here.
         today: current date (used for age and 6-month checks).
+        six_months_ago: precomputed `today - 183 days`. Loop callers
+            pass it once per run so the timedelta arithmetic is not
+            repeated per record; derived here when omitted.
 
     Returns:
         (is_valid, errors, normalized_record)
@@ -145,44 +376,61 @@ def validate_record(
     """
     errors: List[str] = []
 
-    # Support both "Patient ID" and "PatientID"
-    patient_id = (raw_record.get("Patient ID")
-                  or raw_record.get("PatientID") or "").strip()
-    health_card = (raw_record.get("Health Card Number")
-                   or "").replace(" ", "").strip()
-    version_code = (raw_record.get("Version Code") or "").strip()
-    dob_str = (raw_record.get("Date of Birth") or "").strip()
-    service_str = (raw_record.get("Service Date") or "").strip()
+    patient_id, health_card, version_code, dob_str, service_str = raw_record
+    patient_id = patient_id.strip()
+    health_card = health_card.replace(" ", "").strip()
+    version_code = version_code.strip()
+    dob_str = dob_str.strip()
+    service_str = service_str.strip()
 
     # ---- Rule 1: Health Card Number ----
-    if not health_card:
+    if _HC_RE.match(health_card):
+        if not _luhn10(health_card):
+            errors.append("Health card number failed MOD 10 (Luhn) validation")
+    elif not health_card:
         errors.append("Health card number is missing")
-    elif not health_card.isdigit():
+    elif not (health_card.isascii() and health_card.isdigit()):
+        # isdigit() alone is True for non-ASCII digits (e.g. Arabic-
+        # Indic), which _HC_RE rejects; without the isascii() check a
+        # 10-character card in those digits would be misreported as a
+        # length problem.
         errors.append("Health card number must contain only digits")
-    elif len(health_card) != 10:
-        errors.append("Health card number must be exactly 10 digits")
     else:
-        if not luhn_check(health_card):
-            errors.append("Health card number failed MOD 10 (Luhn) validation")
+        errors.append("Health card number must be exactly 10 digits")
 
     # ---- Rule 2: Version Code ----
-    if not version_code:
-        errors.append("Version code is missing")
-    elif len(version_code) != 2:
-        errors.append("Version code must be exactly 2 characters")
-    elif not version_code.isalpha():
-        errors.append("Version code must contain only letters A-Z")
-    elif not version_code.isupper():
-        errors.append("Version code must be uppercase letters (A-Z)")
+    if not _VC_RE.match(version_code):
+        if not version_code:
+            errors.append("Version code is missing")
+        elif len(version_code) != 2:
+            errors.append("Version code must be exactly 2 characters")
+        elif not version_code.isalpha():
+            errors.append("Version code must contain only letters A-Z")
+        else:
+            errors.append("Version code must be uppercase letters (A-Z)")
+
+    # A record that already failed rule 1 or 2 can never normalize, so
+    # its dates are only needed for the error report: run the cheap
+    # shape check instead of the full parse and skip the range rules.
+    if errors:
+        _check_date_shape(dob_str, "Date of birth", errors)
+        _check_date_shape(service_str, "Service date", errors)
+        if not patient_id:
+            errors.append("Patient ID is missing")
+        return False, errors, None
 
     # ---- Rule 3: Date of Birth ----
     dob = parse_date_flex(dob_str, "Date of birth", errors)
     if dob:
+        # Packed YYYYMMDD ints serve both the future check and the age
+        # computation without further date-object arithmetic.
+        dob_int = dob.year * 10000 + dob.month * 100 + dob.day
+        today_int = today.year * 10000 + today.month * 100 + today.day
         # DOB cannot be in the future
-        if dob > today:
+        if dob_int > today_int:
             errors.append("Date of birth is in the future")
         else:
-            age = age_in_years(dob, today)
+            age = (today_int - dob_int) // 10000
             if age < 0:
                 errors.append("Patient age cannot be negative")
             if age >= 150:
@@ -201,7 +449,8 @@ def validate_record(
 
         # Service date cannot be more than 6 months in the past
         # Here we approximate 6 months as 183 days
-        six_months_ago = today - timedelta(days=183)
+        if six_months_ago is None:
+            six_months_ago = today - timedelta(days=183)
         if service_date < six_months_ago:
             errors.append("Service date is more than 6 months in the past")
 
@@ -231,13 +480,268 @@ def validate_record(
     return True, [], normalized_record
 
 
+def validate_records_batch(
+    raw_records: List[RawRecord],
+    today: date
+) -> Tuple[ValidRecords, List[Tuple[str, List[str]]]]:
+    """
+    Vectorized equivalent of running validate_record over a whole batch.
+    Requires pandas.
+
+    The structural checks (health card format + Luhn, version code,
+    date parse and range rules) run as columnar operations; only rows
+    that fail some rule fall back to validate_record, which stays the
+    single source of truth for error messages.
+
+    Returns:
+        (valid_records, error_info) in input row order. Valid rows are
+        collected columnar as a ValidRecords batch rather than one
+        PatientRecord per row.
+    """
+    df = pd.DataFrame(
+        raw_records,
+        columns=["patient_id", "health_card", "version_code",
+                 "dob", "service"],
+        dtype=object,
+    )
+
+    patient_id = df["patient_id"].str.strip()
+    health_card = (df["health_card"]
+                   .str.replace(" ", "", regex=False).str.strip())
+    version_code = df["version_code"].str.strip()
+    dob = df["dob"].str.strip().map(_parse_date_cached)
+    service = df["service"].str.strip().map(_parse_date_cached)
+
+    # Explicit character classes rather than the compiled module patterns:
+    # pandas refuses compiled regexes carrying re.ASCII, and [0-9] keeps
+    # the same ASCII-only semantics as _HC_RE.
+    hc_ok = health_card.str.match(r"[0-9]{10}$")
+    # Luhn only on the subset that already matched the format regex.
+    if numba is not None and hc_ok.any():
+        digits = np.frombuffer(
+            "".join(health_card[hc_ok]).encode("ascii"), np.uint8
+        ).reshape(-1, 10) - 48
+        hc_ok[hc_ok] = _luhn_batch(digits)
+    else:
+        hc_ok[hc_ok] = health_card[hc_ok].map(_luhn10)
+    vc_ok = version_code.str.match(r"[A-Z]{2}$")
+
+    six_months_ago = today - timedelta(days=183)
+    if numba is not None and dob.notna().any():
+        parsed = dob.notna()
+        sub = dob[parsed]
+        ages = _age_batch(
+            np.fromiter((d.year for d in sub), np.int32, len(sub)),
+            np.fromiter((d.month for d in sub), np.int32, len(sub)),
+            np.fromiter((d.day for d in sub), np.int32, len(sub)),
+            today.year, today.month, today.day,
+        )
+        dob_ok = parsed.copy()
+        dob_ok[parsed] = [d <= today and a < 150
+                          for d, a in zip(sub, ages)]
+    else:
+        dob_ok = dob.map(
+            lambda d: d is not None and d <= today and age_in_years(d, today) < 150
+        )
+    service_ok = service.map(
+        lambda d: d is not None and six_months_ago <= d <= today
+    )
+    order_ok = pd.Series(
+        [d is not None and s is not None and s >= d
+         for d, s in zip(dob, service)],
+        index=df.index,
+    )
+
+    row_ok = (hc_ok & vc_ok & dob_ok & service_ok & order_ok
+              & (patient_id != "")).tolist()
+
+    valid_records = ValidRecords()
+    error_info: List[Tuple[str, List[str]]] = []
+
+    pid_list = patient_id.tolist()
+    hc_list = health_card.tolist()
+    vc_list = version_code.tolist()
+    dob_list = dob.tolist()
+    service_list = service.tolist()
+
+    for i, ok in enumerate(row_ok):
+        if ok:
+            valid_records.append(
+                pid_list[i],
+                hc_list[i],
+                vc_list[i],
+                dob_list[i].isoformat(),
+                service_list[i].isoformat(),
+            )
+        else:
+            is_valid, errors, normalized = validate_record(
+                raw_records[i], today, six_months_ago
+            )
+            if is_valid and normalized:
+                valid_records.append(
+                    normalized.PatientID,
+                    normalized.HealthCardNumber,
+                    normalized.VersionCode,
+                    normalized.DateOfBirth,
+                    normalized.ServiceDate,
+                )
+            else:
+                error_info.append((pid_list[i], errors))
+
+    return valid_records, error_info
+
+
 # ==============================
 # PDF extraction
 # ==============================
 
-def extract_records_from_pdf(pdf_path: str) -> List[Dict[str, str]]:
+def _iter_table_records(
+    table: List[List[Optional[str]]]
+) -> Iterator[RawRecord]:
     """
-    Extract tabular records from a PDF using pdfplumber.
+    Turn one extracted table (first row = header) into canonical field
+    tuples, yielded one at a time. Shared by both PDF backends.
+
+    The header row is resolved against CANONICAL_HEADERS once per
+    table; each data row then fills a fixed 5-slot list by column
+    index, with no per-row dict construction or header lookups.
+    """
+    header_row = table[0]
+    if not header_row:
+        return
+
+    # Map each column index to its canonical field slot (None = ignore).
+    slots: List[Optional[int]] = []
+    for col in header_row:
+        header = "" if col is None else str(col).strip().lower()
+        slots.append(CANONICAL_HEADERS.get(header))
+
+    # Iterate over the remaining rows
+    for row in table[1:]:
+        if not row:
+            continue
+        # Skip an entirely empty row
+        if all(cell is None or str(cell).strip() == "" for cell in row):
+            continue
+
+        fields = [""] * FIELD_COUNT
+        for idx, cell in enumerate(row):
+            if idx >= len(slots):
+                continue
+            slot = slots[idx]
+            if slot is None or cell is None:
+                continue
+            if not isinstance(cell, str):
+                cell = str(cell)
+            # Intern: dates and version codes repeat heavily across
+            # rows, so duplicates share one object and downstream dict
+            # lookups (e.g. the date cache) hit on identity.
+            fields[slot] = sys.intern(cell.strip())
+
+        yield tuple(fields)
+
+
+def _extract_with_pdfplumber(pdf_path: str) -> Iterator[RawRecord]:
+    """
+    Extract records with the pdfplumber backend (pure Python, slow but
+    battle-tested on awkward layouts).
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            table = page.extract_table()
+            if not table:
+                continue
+            yield from _iter_table_records(table)
+
+
+def _extract_with_pymupdf(pdf_path: str) -> Iterator[RawRecord]:
+    """
+    Extract records with the PyMuPDF backend (C-backed, orders of
+    magnitude faster than pdfplumber on the same content).
+    """
+    with pymupdf.open(pdf_path) as doc:
+        for page in doc:
+            for tab in page.find_tables().tables:
+                table = tab.extract()
+                if not table:
+                    continue
+                yield from _iter_table_records(table)
+
+
+def _extract_page_range(
+    pdf_path: str,
+    use_pymupdf: bool,
+    start: int,
+    stop: int
+) -> List[RawRecord]:
+    """
+    Pool worker: re-open the PDF (neither backend is fork-safe) and
+    extract records from pages [start, stop).
+    """
+    records: List[RawRecord] = []
+    if use_pymupdf:
+        with pymupdf.open(pdf_path) as doc:
+            for page_no in range(start, stop):
+                for tab in doc[page_no].find_tables().tables:
+                    table = tab.extract()
+                    if table:
+                        records.extend(_iter_table_records(table))
+    else:
+        with pdfplumber.open(pdf_path) as pdf:
+            for page_no in range(start, stop):
+                table = pdf.pages[page_no].extract_table()
+                if table:
+                    records.extend(_iter_table_records(table))
+    return records
+
+
+def _extract_parallel(
+    pdf_path: str,
+    use_pymupdf: bool,
+    workers: int
+) -> Iterator[RawRecord]:
+    """
+    Shard the page range across a process pool; each worker re-opens
+    the PDF and extracts its slice. Results are merged in submission
+    order so row order matches the serial path.
+    """
+    if use_pymupdf:
+        with pymupdf.open(pdf_path) as doc:
+            n_pages = doc.page_count
+    else:
+        with pdfplumber.open(pdf_path) as pdf:
+            n_pages = len(pdf.pages)
+
+    if n_pages <= 1:
+        # Nothing to shard; stay in-process.
+        if use_pymupdf:
+            yield from _extract_with_pymupdf(pdf_path)
+        else:
+            yield from _extract_with_pdfplumber(pdf_path)
+        return
+
+    workers = min(workers, n_pages)
+    chunk = -(-n_pages // workers)  # ceil division
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_extract_page_range, pdf_path, use_pymupdf,
+                        start, min(start + chunk, n_pages))
+            for start in range(0, n_pages, chunk)
+        ]
+        for future in futures:
+            yield from future.result()
+
+
+def extract_records_from_pdf(
+    pdf_path: str,
+    backend: str = "auto",
+    workers: int = 1
+) -> Iterator[RawRecord]:
+    """
+    Extract tabular records from a PDF, streaming one canonical field
+    tuple at a time so large PDFs never materialize the whole record
+    list and validation can overlap page parsing.
 
     Assumptions:
         - PDF contains one or more tables.
@@ -246,73 +750,79 @@ def extract_records_from_pdf(pdf_path: str) -> List[Dict[str, str]]:
           "Patient ID", "Health Card Number", "Version Code",
           "Date of Birth", "Service Date".
 
-    Returns:
-        A list of dictionaries, one per row (record).
+    Args:
+        pdf_path: input PDF file path.
+        backend: "pymupdf", "plumber", or "auto" (default). "auto"
+            prefers PyMuPDF when installed and falls back to pdfplumber
+            when it is missing or its table finder comes up empty.
+        workers: number of page-extraction processes. 1 (default) stays
+            serial; more shards the page range across a process pool,
+            which pays off on multi-page PDFs.
+
+    Yields:
+        One RawRecord tuple per row. As a generator, file and parse
+        errors surface when the iterator is advanced, not at call time.
     """
     if not os.path.exists(pdf_path):
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
-    records: List[Dict[str, str]] = []
+    produced = False
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                table = page.extract_table()
-                if not table:
-                    continue
-
-                header_row = table[0]
-                if not header_row:
-                    continue
-
-                # Normalize header strings
-                headers: List[str] = []
-                for col in header_row:
-                    if col is None:
-                        headers.append("")
-                    else:
-                        headers.append(str(col).strip())
-
-                # Iterate over the remaining rows
-                for row in table[1:]:
-                    if not row:
-                        continue
-                    # Skip an entirely empty row
-                    if all(cell is None or str(cell).strip() == "" for cell in row):
-                        continue
-
-                    row_dict: Dict[str, str] = {}
-                    for idx, cell in enumerate(row):
-                        if idx >= len(headers):
-                            continue
-                        key = headers[idx]
-                        value = "" if cell is None else str(cell).strip()
-                        row_dict[key] = value
-
-                    records.append(row_dict)
-
+        if backend == "pymupdf" or (backend == "auto" and pymupdf is not None):
+            if pymupdf is None:
+                raise RuntimeError("PyMuPDF backend requested but not installed")
+            source = (_extract_parallel(pdf_path, True, workers)
+                      if workers > 1 else _extract_with_pymupdf(pdf_path))
+            for record in source:
+                produced = True
+                yield record
+
+        if not produced and backend != "pymupdf":
+            if pdfplumber is None:
+                raise RuntimeError("pdfplumber backend requested but not installed")
+            if workers > 1:
+                yield from _extract_parallel(pdf_path, False, workers)
+            else:
+                yield from _extract_with_pdfplumber(pdf_path)
+
+    except RuntimeError:
+        raise
     except Exception as e:
         raise RuntimeError(f"Error reading or parsing PDF: {e}")
 
-    return records
-
 
 # ==============================
 # Output writers
 # ==============================
 
-def write_valid_csv(valid_records: List[PatientRecord], output_path: str) -> None:
+def write_valid_csv(
+    valid_records: Union[ValidRecords, List[PatientRecord]],
+    output_path: str
+) -> None:
     """
     Write valid normalized records to a CSV file.
+
+    Accepts either a columnar ValidRecords batch (written with a single
+    zip+writerows pass) or a list of PatientRecord rows.
     """
     fieldnames = ["PatientID", "HealthCardNumber",
                   "VersionCode", "DateOfBirth", "ServiceDate"]
 
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for record in valid_records:
-            writer.writerow(asdict(record))
+    # Binary mode with a 1 MiB buffer and an explicit utf-8 wrapper:
+    # fewer write syscalls and no locale-encoder lookup per row.
+    with open(output_path, "wb", buffering=1 << 20) as raw, \
+            io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        if isinstance(valid_records, ValidRecords):
+            writer.writerows(zip(*valid_records.columns()))
+        else:
+            # attrgetter pulls all five fields per record in one
+            # C-level call, so the whole write is a single map+writerows
+            # pass with no Python-level tuple building.
+            get_fields = operator.attrgetter(*fieldnames)
+            writer.writerows(map(get_fields, valid_records))
 
 
 def write_error_report(
@@ -333,27 +843,36 @@ def write_error_report(
     """
     generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    lines: List[str] = []
-    lines.append("ERROR REPORT")
-    lines.append(f"Generated: {generated_at}")
-    lines.append(f"Total Records Processed: {total_count}")
-    lines.append(f"Valid Records: {valid_count}")
-    lines.append(f"Invalid Records: {invalid_count}")
-    lines.append("")
-    lines.append("INVALID RECORDS:")
+    # Bytes-level builder: pre-encoded prefixes and bytearray appends
+    # replace one f-string allocation per report line, which dominates
+    # on PDFs with thousands of invalid rows.
+    buf = bytearray()
+    buf += (
+        "ERROR REPORT\n"
+        f"Generated: {generated_at}\n"
+        f"Total Records Processed: {total_count}\n"
+        f"Valid Records: {valid_count}\n"
+        f"Invalid Records: {invalid_count}\n"
+        "\n"
+        "INVALID RECORDS:\n"
+    ).encode("utf-8")
 
     if invalid_count == 0:
-        lines.append("(none)")
+        buf += b"(none)"
     else:
+        prefix = b"Patient ID: "
+        dash = b"\n- "
         for patient_id, errors in error_info:
-            display_id = patient_id if patient_id else "<MISSING_PATIENT_ID>"
-            lines.append(f"Patient ID: {display_id}")
+            buf += prefix
+            buf += (patient_id or "<MISSING_PATIENT_ID>").encode("utf-8")
             for err in errors:
-                lines.append(f"- {err}")
-            lines.append("")  # blank line between records
+                buf += dash
+                buf += err.encode("utf-8")
+            buf += b"\n\n"  # blank line between records
+        del buf[-1:]  # the report never ended with a double newline
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    with open(output_path, "wb") as f:
+        f.write(buf)
 
 
 # ==============================
@@ -387,13 +906,56 @@ def main() -> None:
         default="error_report.txt",
         help="Output text file for error report (default: error_report.txt)"
     )
+    parser.add_argument(
+        "--pdf_backend",
+        choices=["auto", "pymupdf", "plumber"],
+        default="auto",
+        help="PDF table-extraction backend (default: auto = PyMuPDF when "
+             "installed, falling back to pdfplumber)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Page-extraction worker processes (default: 1 = serial; "
+             "try your CPU count for large multi-page PDFs)"
+    )
 
     args = parser.parse_args()
     pdf_path = args.pdf_path
 
-    # Extract raw records from PDF
+    today = date.today()
+
+    valid_records: Union[ValidRecords, List[PatientRecord]] = []
+    error_info: List[Tuple[str, List[str]]] = []
+    total_count = 0
+
+    # Extraction streams row tuples; errors surface while consuming.
+    record_iter = extract_records_from_pdf(
+        pdf_path, backend=args.pdf_backend, workers=args.workers
+    )
+
     try:
-        raw_records = extract_records_from_pdf(pdf_path)
+        if pd is not None:
+            # The vectorized path works on the whole batch; only the
+            # streaming loop below keeps peak memory flat.
+            raw_records = list(record_iter)
+            total_count = len(raw_records)
+            valid_records, error_info = validate_records_batch(raw_records, today)
+        else:
+            # Validate each record as it comes off the page parser.
+            six_months_ago = today - timedelta(days=183)
+            for raw in record_iter:
+                total_count += 1
+                is_valid, errors, normalized = validate_record(
+                    raw, today, six_months_ago
+                )
+                patient_id = raw[0].strip()
+
+                if is_valid and normalized:
+                    valid_records.append(normalized)
+                else:
+                    error_info.append((patient_id, errors))
     except FileNotFoundError as e:
         print(f"[ERROR] {e}", file=sys.stderr)
         sys.exit(1)
@@ -401,27 +963,9 @@ def main() -> None:
         print(f"[ERROR] {e}", file=sys.stderr)
         sys.exit(1)
 
-    if not raw_records:
+    if total_count == 0:
         print("[WARNING] No records found in PDF.")
         # We still continue and write empty outputs for completeness.
-
-    today = date.today()
-
-    valid_records: List[PatientRecord] = []
-    error_info: List[Tuple[str, List[str]]] = []
-
-    # Validate each record
-    for raw in raw_records:
-        is_valid, errors, normalized = validate_record(raw, today)
-        patient_id = (raw.get("Patient ID") or raw.get(
-            "PatientID") or "").strip()
-
-        if is_valid and normalized:
-            valid_records.append(normalized)
-        else:
-            error_info.append((patient_id, errors))
-
-    total_count = len(raw_records)
     valid_count = len(valid_records)
     invalid_count = len(error_info)
 
@@ -441,3 +985,7 @@ def main() -> None:
 
     # Console summary
     print("Processing completed.")
+
+
+if __name__ == "__main__":
+    main()